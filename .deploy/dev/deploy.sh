@@ -14,6 +14,7 @@ export NAMESPACE=dev-starter-pack-naughty-swanson
 cd `dirname "$0"`
 cat configmap.yaml | sed "s/<COMMIT_HASH>/$COMMIT_HASH/" | kubectl apply -f -
 kubectl apply -f psql_root_crt.yaml
+kubectl apply -f redis.yaml
 
 cat migrate.yaml | sed "s/<COMMIT_HASH>/$COMMIT_HASH/" | kubectl create -f -
 
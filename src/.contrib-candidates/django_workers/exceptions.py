@@ -38,6 +38,11 @@ class TaskError(Exception):
         finally:
             cls._default_task_id.reset(var_token)
 
+    @classmethod
+    def get_default_task_id(cls) -> int | None:
+        """Get task id value configured in context with `set_default_task_id` if any."""
+        return cls._default_task_id.get(None)
+
     @classmethod
     @contextmanager
     def convert_exceptions(cls, reason_code: str, *exception_types, task_id: int | None = None, description: str = ''):
@@ -37,16 +37,17 @@ def track_and_run_tasks(  # noqa CCR001
 
             task_id = getattr(task, task_queue.task_id_field_name)
 
-            logger.info('New task found id=%s', task_id)
+            # context is set for all task related records to let log handlers add task id to them
+            with TaskError.set_default_task_id(task_id):
+                logger.info('New task found id=%s', task_id)
 
-            try:
-                with TaskError.set_default_task_id(task_id):
+                try:
                     with TaskError.convert_exceptions('unhandled_exception'):
                         task_queue.handle_task(task)
                         logger.info('Processed successfully task id=%s', task_id)
-            except TaskError as error:
-                task_queue.process_task_error(task, error)
-                logger.exception('Failed task id=%s', task_id)
+                except TaskError as error:
+                    task_queue.process_task_error(task, error)
+                    logger.exception('Failed task id=%s', task_id)
 
 
 class Command(BaseCommand):
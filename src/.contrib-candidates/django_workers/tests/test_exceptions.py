@@ -25,6 +25,15 @@ def test_default_task_id():
         TaskError(reason_code='without_task_id')
 
 
+def test_get_default_task_id():
+    assert TaskError.get_default_task_id() is None
+
+    with TaskError.set_default_task_id(999):
+        assert TaskError.get_default_task_id() == 999
+
+    assert TaskError.get_default_task_id() is None
+
+
 def test_wrap_all_unhandled_exceptions():
     with pytest.raises(TaskError) as excinfo:
         with TaskError.set_default_task_id(999):
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class AuthConfig(AppConfig):
@@ -6,3 +7,10 @@ class AuthConfig(AppConfig):
     name = 'auth'
     label = 'project_auth'
     verbose_name = 'Аутентификация'
+
+    def ready(self):
+        from .backends import invalidate_cached_user
+
+        user_model = self.get_model('User')
+        post_save.connect(invalidate_cached_user, sender=user_model)
+        post_delete.connect(invalidate_cached_user, sender=user_model)
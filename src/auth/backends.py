@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_user_cache_key(user_id) -> str:
+    return f'auth:user:{user_id}'
+
+
+class CachedModelBackend(ModelBackend):
+    """Model backend caching users loaded by AuthenticationMiddleware on every request.
+
+    Cached user is invalidated on User save or delete. Bulk `QuerySet.update()` calls skip model signals, so affected
+    users stay stale until AUTH_USER_CACHE_TIMEOUT expires.
+
+    Cache should be shared by all app server and worker processes, otherwise changes made in one process are not
+    seen by the others until the timeout expires.
+    """
+
+    def get_user(self, user_id):
+        cache_key = get_user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(cache_key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+        return user
+
+
+def invalidate_cached_user(sender, instance, **kwargs) -> None:
+    cache_key = get_user_cache_key(instance.pk)
+    cache.delete(cache_key)
+    # concurrent requests may cache old user state until the transaction is committed
+    transaction.on_commit(lambda: cache.delete(cache_key))
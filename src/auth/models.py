@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class User(AbstractUser):
@@ -15,3 +17,8 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
+        # Trigram indexes speed up admin search with `UPPER(field) LIKE UPPER('%query%')` SQL queries
+        indexes = [
+            GinIndex(OpClass(Upper(field_name), name='gin_trgm_ops'), name=f'user_{field_name}_trgm_idx')
+            for field_name in ['username', 'first_name', 'last_name', 'email']
+        ]
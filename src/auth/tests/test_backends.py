@@ -0,0 +1,87 @@
+import runpy
+
+import pytest
+from django.contrib.auth import get_user
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from ..backends import CachedModelBackend
+from ..models import User
+
+
+@pytest.fixture()
+def locmem_cache(settings):
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
+    # local memory caches with the same location share storage, so drop users cached by other tests
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_user_loaded_from_cache(locmem_cache, monkeypatch):
+    loaded_user_ids = []
+
+    def get_user(self, user_id):
+        loaded_user_ids.append(user_id)
+        return User(pk=user_id, username='admin')
+
+    monkeypatch.setattr(ModelBackend, 'get_user', get_user)
+    backend = CachedModelBackend()
+
+    assert backend.get_user(1).username == 'admin'
+    assert backend.get_user(1).username == 'admin'
+    assert loaded_user_ids == [1]
+
+
+def test_missing_user_not_cached(locmem_cache, monkeypatch):
+    monkeypatch.setattr(ModelBackend, 'get_user', lambda self, user_id: None)
+
+    assert CachedModelBackend().get_user(1) is None
+    assert cache.get('auth:user:1') is None
+
+
+@pytest.mark.django_db
+def test_cache_invalidated_on_user_save(locmem_cache):
+    user = User.objects.create(username='admin')
+    backend = CachedModelBackend()
+    backend.get_user(user.pk)
+
+    user.first_name = 'Пользователь'
+    user.save()
+
+    assert backend.get_user(user.pk).first_name == 'Пользователь'
+
+
+def test_database_backends_used_without_shared_cache(settings, monkeypatch):
+    monkeypatch.delenv('CACHE__BACKEND', raising=False)
+    monkeypatch.delenv('CACHE__LOCATION', raising=False)
+    project_settings = runpy.run_path(settings.BASE_DIR / 'project' / 'settings.py')
+
+    assert 'CACHES' not in project_settings
+    assert 'SESSION_ENGINE' not in project_settings
+    assert 'AUTHENTICATION_BACKENDS' not in project_settings
+
+
+def test_cached_backends_used_with_shared_cache(settings, monkeypatch):
+    monkeypatch.setenv('CACHE__BACKEND', 'redis')
+    monkeypatch.setenv('CACHE__LOCATION', 'redis://localhost:6379/0')
+    project_settings = runpy.run_path(settings.BASE_DIR / 'project' / 'settings.py')
+
+    assert project_settings['SESSION_ENGINE'] == 'django.contrib.sessions.backends.cached_db'
+    assert project_settings['AUTHENTICATION_BACKENDS'] == [
+        'auth.backends.CachedModelBackend',
+        'django.contrib.auth.backends.ModelBackend',
+    ]
+
+
+@pytest.mark.django_db
+def test_session_of_model_backend_kept_with_shared_cache(locmem_cache, settings, client):
+    settings.AUTHENTICATION_BACKENDS = ['auth.backends.CachedModelBackend', 'django.contrib.auth.backends.ModelBackend']
+    user = User.objects.create(username='admin')
+    client.force_login(user, backend='django.contrib.auth.backends.ModelBackend')
+
+    assert get_user(client).is_authenticated
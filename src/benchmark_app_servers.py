@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""Compare throughput and memory usage of Gunicorn serving Django app in WSGI and ASGI modes.
+
+Each mode is started as a separate Gunicorn process on a local port, warmed up and loaded with concurrent requests.
+Memory is measured as total RSS of Gunicorn master and worker processes after the load.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+
+def get_children_pids(pid: int) -> list[int]:
+    children_pids = []
+    for stat_path in Path('/proc').glob('[0-9]*/stat'):
+        try:
+            stat = stat_path.read_text()
+        except OSError:
+            continue
+        # process name may contain spaces, so parse fields after the closing bracket
+        parent_pid = int(stat.rpartition(')')[2].split()[1])
+        if parent_pid == pid:
+            children_pids.append(int(stat_path.parent.name))
+    return children_pids
+
+
+def get_rss_kb(pid: int) -> int:
+    for line in Path(f'/proc/{pid}/status').read_text().splitlines():
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1])
+    return 0
+
+
+def start_server(server_interface: str, port: int, workers: int) -> subprocess.Popen:
+    env = os.environ | {'SERVER_INTERFACE': server_interface}
+    return subprocess.Popen(
+        ['gunicorn', '--bind', f'127.0.0.1:{port}', '--workers', str(workers)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_for_server(client: httpx.AsyncClient, url: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            await client.get(url)
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f'Server is not available at {url}')
+
+
+async def run_load(client: httpx.AsyncClient, url: str, requests_count: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors_count = 0
+
+    async def send_request():
+        nonlocal errors_count
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                response = await client.get(url)
+                if response.is_error:
+                    errors_count += 1
+            except httpx.TransportError:
+                errors_count += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(send_request() for _ in range(requests_count)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        'rps': requests_count / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'errors': errors_count,
+    }
+
+
+async def benchmark(server_interface: str, options: argparse.Namespace) -> dict:
+    url = f'http://127.0.0.1:{options.port}{options.path}'
+    server = start_server(server_interface, options.port, options.workers)
+    try:
+        limits = httpx.Limits(max_connections=options.concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+            await wait_for_server(client, url)
+            await run_load(client, url, options.warmup, options.concurrency)
+            results = await run_load(client, url, options.requests, options.concurrency)
+        pids = [server.pid, *get_children_pids(server.pid)]
+        results['rss_mb'] = sum(get_rss_kb(pid) for pid in pids) / 1024
+        return results
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--path', default='/admin/login/', help='URL path to request.')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests count per mode.')
+    parser.add_argument('--warmup', type=int, default=200, help='Requests count sent before measurement.')
+    parser.add_argument('--concurrency', type=int, default=50, help='Concurrent requests count.')
+    parser.add_argument('--workers', type=int, default=2, help='Gunicorn workers count.')
+    parser.add_argument('--port', type=int, default=8100, help='Local port to run Gunicorn on.')
+    options = parser.parse_args()
+
+    print(f'GET {options.path}: {options.requests} requests, concurrency {options.concurrency}, '
+          f'{options.workers} workers')
+    print(f'{"mode":<6}{"req/s":>10}{"p50, ms":>10}{"p95, ms":>10}{"errors":>8}{"RSS, MB":>10}')
+    for server_interface in ['wsgi', 'asgi']:
+        results = asyncio.run(benchmark(server_interface, options))
+        print(
+            f'{server_interface:<6}{results["rps"]:>10.1f}{results["p50_ms"]:>10.1f}{results["p95_ms"]:>10.1f}'
+            f'{results["errors"]:>8}{results["rss_mb"]:>10.1f}',
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -47,13 +47,50 @@ class RollbarSettings(BaseSettings):
     ENVIRONMENT: str
 
 
-class EnvSettings(BaseSettings):
+class CacheSettings(BaseSettings):
+    BACKEND: Literal['file', 'redis']
+    LOCATION: str = Field(
+        description='Directory path for `file` backend or Redis-compatible server URL for `redis` backend. '
+                    'E.g. /var/cache/django or redis://redis:6379/0.',
+    )
+
+
+class LoggingSettings(BaseSettings):
+    LOG_LEVEL: LogLevel = 'INFO'
+
+    LOG_DEBUG_SAMPLE_RATE: float = Field(
+        default=1.0,
+        ge=0,
+        le=1,
+        description='Share of DEBUG log records to output, e.g. 0.01 keeps one record of hundred chosen randomly. '
+                    'Records of other levels are not sampled.',
+    )
+
+    class Config:
+        case_sensitive = True
+
+
+class AppServerSettings(LoggingSettings):
+    SERVER_INTERFACE: Literal['wsgi', 'asgi'] = Field(
+        default='wsgi',
+        description='Application interface served by Gunicorn: `wsgi` with sync workers or `asgi` with uvicorn '
+                    'workers. ASGI lets slow requests to external APIs wait without holding a whole worker.',
+    )
+
+
+class EnvSettings(LoggingSettings):
     DJ: DjangoSettings
 
     POSTGRES_DSN: PostgresDsn
 
     TEMPLATES_ARE_CACHED: bool = False
 
+    READ_ONLY_REQUESTS_MODE: Literal['autocommit', 'read_only'] = Field(
+        default='autocommit',
+        description='How to serve read-only requests, e.g. GET ones: `autocommit` skips wrapping transaction, '
+                    '`read_only` opens READ ONLY transaction. Write requests are always atomic.',
+    )
+
     ENABLE_MEDIA_FILES_SERVING: bool = Field(
         default=False,
         description='Enables serving of media files with Django app server. This feature simplifies development '
@@ -73,6 +110,11 @@ class EnvSettings(BaseSettings):
 
     ROLLBAR: RollbarSettings | None
 
+    CACHE: CacheSettings | None = Field(
+        description='Cache shared by all app server and worker processes. When not specified each process '
+                    'gets its own local memory cache.',
+    )
+
     S3_DSN: AnyUrl | None = Field(
         description='S3 credentials DSN in format specified by s3-parse-url lib. '
                     'Docs: https://github.com/marazmiki/s3-parse-url/tree/master',
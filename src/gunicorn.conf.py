@@ -0,0 +1,25 @@
+"""Gunicorn config loaded automatically from the working directory.
+
+Application interface is selected with SERVER_INTERFACE env param. Other options, e.g. workers count, are specified
+as usual with command line arguments or GUNICORN_CMD_ARGS env param.
+"""
+from env_settings import AppServerSettings
+from project.log_handlers import get_logging_config
+
+SERVER_INTERFACES = {
+    'wsgi': ('project.wsgi:application', 'sync'),
+    'asgi': ('project.asgi:application', 'project.uvicorn_worker.UvicornWorker'),
+}
+
+APP_SERVER_SETTINGS = AppServerSettings()
+
+wsgi_app, worker_class = SERVER_INTERFACES[APP_SERVER_SETTINGS.SERVER_INTERFACE]
+
+# Server and access logs are written in the same JSON format and by the same background thread as Django app logs.
+# Access log is enabled by this config without --access-logfile option. Log level is set with LOG_LEVEL env param
+# for Gunicorn and Django app alike, --log-level option is ignored.
+logconfig_dict = get_logging_config(
+    APP_SERVER_SETTINGS.LOG_LEVEL,
+    APP_SERVER_SETTINGS.LOG_DEBUG_SAMPLE_RATE,
+    loggers=['gunicorn.error', 'gunicorn.access'],
+)
@@ -0,0 +1,116 @@
+import json
+
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.utils.functional import cached_property
+
+KEYSET_VAR = 'after'
+
+
+def estimate_count(queryset: models.QuerySet) -> int:
+    """Get rows count estimated by PostgreSQL query planner from table statistics without full scan."""
+    sql, params = queryset.order_by().query.get_compiler(queryset.db).as_sql()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        [[plan]] = cursor.fetchall()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator counting rows exactly only when the planner expects a few of them."""
+
+    exact_count_threshold = 10_000
+
+    @cached_property
+    def count(self) -> int:
+        estimated_count = estimate_count(self.object_list)
+        if estimated_count < self.exact_count_threshold:
+            return super().count
+        return estimated_count
+
+
+class KeysetChangeList(ChangeList):
+    """Change list paginated by primary key instead of OFFSET when ordered by primary key only.
+
+    Next page is requested with `?after=<last pk on the page>`, so page load time does not depend on how deep into
+    the table user goes. Other orderings fall back to regular page numbers.
+    """
+
+    keyset_after = None
+    keyset_next_url = None
+    keyset_first_url = None
+
+    def __init__(self, request, *args, **kwargs):
+        super().__init__(request, *args, **kwargs)
+        # remove cursor from links to filters, sortings and search form
+        self.params.pop(KEYSET_VAR, None)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(KEYSET_VAR, None)
+        return lookup_params
+
+    @property
+    def keyset_ordering(self) -> str | None:
+        # ordering of ModelAdmin.get_queryset() may be appended to the ordering of the change list
+        ordering = tuple(dict.fromkeys(self.queryset.query.order_by))
+        return ordering[0] if ordering in {('pk',), ('-pk',)} else None
+
+    @property
+    def is_keyset_paginated(self) -> bool:
+        return self.keyset_ordering is not None
+
+    def get_keyset_queryset(self, request) -> models.QuerySet:
+        if KEYSET_VAR not in request.GET:
+            return self.queryset
+
+        try:
+            self.keyset_after = int(request.GET[KEYSET_VAR])
+        except ValueError:
+            raise IncorrectLookupParameters
+        lookup = 'pk__lt' if self.keyset_ordering == '-pk' else 'pk__gt'
+        return self.queryset.filter(**{lookup: self.keyset_after})
+
+    def get_results(self, request):
+        if not self.is_keyset_paginated:
+            return super().get_results(request)
+
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        keyset_queryset = self.get_keyset_queryset(request)
+        # result list should stay a queryset, e.g. list_editable formset requires it
+        result_list = keyset_queryset[:self.list_per_page]
+        has_next_page = keyset_queryset[self.list_per_page:self.list_per_page + 1].exists()
+
+        if has_next_page:
+            self.keyset_next_url = self.get_query_string({KEYSET_VAR: list(result_list)[-1].pk})
+        if self.keyset_after is not None:
+            self.keyset_first_url = self.get_query_string(remove=[KEYSET_VAR])
+
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = result_list
+        self.can_show_all = False
+        self.multi_page = has_next_page or self.keyset_after is not None
+        self.paginator = paginator
+
+
+class LargeTableAdminMixin:
+    """Model admin mixin for changelists of tables with millions of rows.
+
+    Skips exact COUNT(*) queries and paginates by primary key. Supporting indexes for `search_fields` should be
+    created separately, e.g. trigram GIN indexes for icontains lookups.
+    """
+
+    ordering = ('-pk',)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    change_list_template = 'admin/large_table_change_list.html'
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
@@ -0,0 +1,181 @@
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueListener
+from typing import Iterable
+
+_exception_formatter = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log record as a single line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:  # noqa: A003
+        payload = {
+            'time': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        task_id = getattr(record, 'task_id', None)
+        if task_id is not None:
+            payload['task_id'] = task_id
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload['exception'] = record.exc_text
+        if record.stack_info:
+            payload['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TaskIdFilter(logging.Filter):
+    """Add id of the task being processed by django_workers to log records as `task_id` attribute."""
+
+    def __init__(self):
+        super().__init__()
+        # imported here to keep the module light for import from settings and Gunicorn config
+        from django_workers import TaskError
+
+        self.get_task_id = TaskError.get_default_task_id
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: A003
+        record.task_id = self.get_task_id()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Pass only specified share of DEBUG records chosen randomly. Records of other levels are passed all."""
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: A003
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+class _QueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # wait for free space in the queue, otherwise the listener thread never stops
+        self.queue.put(self._sentinel)
+
+
+class QueueListenerHandler(logging.Handler):
+    """Handler moving records formatting and output to a background thread.
+
+    Records are put to a bounded queue and written to the stream by QueueListener thread. The thread is started on
+    the first record in every process, because Gunicorn configures logging in master process before forking workers
+    and threads do not survive fork. Records are dropped when the queue is full, so a slow stream never blocks
+    request and task processing.
+
+    Formatter configured for the handler is applied in the listener thread. The handler is not a QueueHandler
+    subclass, because since Python 3.12 dictConfig configures such handlers in its own way with a listener running
+    in the configuring process only.
+    """
+
+    def __init__(self, stream=None, maxsize: int = 10_000):
+        super().__init__()
+        self.maxsize = maxsize
+        self.queue = queue.Queue(maxsize)
+        self.target = logging.StreamHandler(stream or sys.stdout)
+        self.listener: _QueueListener | None = None
+        self.listener_pid: int | None = None
+        self.listener_lock = threading.Lock()
+
+    def setFormatter(self, fmt: logging.Formatter | None) -> None:  # noqa: N802
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Message arguments and traceback may change or hold resources after the call, so render them to text in the
+        # calling thread. JSON rendering and output are left to the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.listener_pid != os.getpid():
+            self.start_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+    def start_listener(self) -> None:
+        with self.listener_lock:
+            if self.listener_pid == os.getpid():
+                return
+            # records left in the queue copied from parent process belong to parent's listener
+            self.queue = queue.Queue(self.maxsize)
+            self.listener = _QueueListener(self.queue, self.target)
+            self.listener.start()
+            self.listener_pid = os.getpid()
+
+    def close(self) -> None:
+        # flush queued records on interpreter shutdown
+        with self.listener_lock:
+            if self.listener and self.listener_pid == os.getpid():
+                self.listener.stop()
+            self.listener = self.listener_pid = None
+        super().close()
+
+
+def get_logging_config(level: str, debug_sample_rate: float, loggers: Iterable[str] = ()) -> dict:
+    """Build dictConfig logging config writing all records to stdout as JSON lines by QueueListenerHandler.
+
+    Root logger and the specified loggers output records of the level and above. Specified loggers do not propagate
+    records to the root, so their own default handlers, e.g. of Django or Gunicorn loggers, are replaced.
+    """
+    return {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'json': {
+                '()': 'project.log_handlers.JsonFormatter',
+            },
+        },
+        'filters': {
+            'task_id': {
+                '()': 'project.log_handlers.TaskIdFilter',
+            },
+            'debug_sampling': {
+                '()': 'project.log_handlers.DebugSamplingFilter',
+                'rate': debug_sample_rate,
+            },
+        },
+        'handlers': {
+            'queue': {
+                'class': 'project.log_handlers.QueueListenerHandler',
+                'formatter': 'json',
+                'filters': ['debug_sampling', 'task_id'],
+            },
+        },
+        'root': {
+            'handlers': ['queue'],
+            'level': level,
+        },
+        'loggers': {
+            logger_name: {
+                'handlers': ['queue'],
+                'level': level,
+                'propagate': False,
+            }
+            for logger_name in loggers
+        },
+    }
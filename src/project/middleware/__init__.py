@@ -0,0 +1,187 @@
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.contrib.auth import middleware as auth_middleware
+from django.db import connections, transaction
+from django.middleware import clickjacking, common, security
+from django.http import HttpRequest, HttpResponse
+from django.urls import Resolver404, resolve
+from whitenoise import middleware as whitenoise_middleware
+
+READ_ONLY_REQUESTS_MODES = ('autocommit', 'read_only')
+
+
+def get_static_path_prefixes() -> list[str]:
+    """Get URL path prefixes of static and media files from STATIC_URL and MEDIA_URL settings."""
+    paths = [urlsplit(url).path for url in [settings.STATIC_URL, settings.MEDIA_URL] if url]
+    # media files are not served by the app when MEDIA_URL is the site root
+    return [path for path in paths if path.startswith('/') and path != '/']
+
+
+class ReadOnlyRequestsMiddleware:
+    """Replace ATOMIC_REQUESTS with per-request choice of transaction mode.
+
+    Write requests are wrapped into `transaction.atomic()` just like ATOMIC_REQUESTS does. Read-only requests are
+    recognized by HTTP method or URL prefix and served either in autocommit mode without any wrapping transaction, or
+    inside a `READ ONLY` transaction on the `settings.READ_ONLY_REQUESTS_DB_ALIAS` database. URL prefixes are taken
+    from STATIC_URL, MEDIA_URL and `settings.READ_ONLY_REQUESTS_PATH_PREFIXES`.
+
+    Views decorated with `transaction.non_atomic_requests` are served in autocommit mode when the decorator lists
+    the database the transaction would be opened on. The view is resolved by the middleware for this check.
+
+    Requires `ATOMIC_REQUESTS` to be disabled, otherwise views get wrapped twice. Place the middleware close to the
+    bottom of the list to keep the transaction as short as ATOMIC_REQUESTS does.
+
+    Under ASGI requests served in autocommit mode stay in the event loop. Django transactions are sync only, so the
+    other requests switch to a thread to open the transaction, and the view runs in the same thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+        self.mode = settings.READ_ONLY_REQUESTS_MODE
+        if self.mode not in READ_ONLY_REQUESTS_MODES:
+            raise ImproperlyConfigured(
+                f'READ_ONLY_REQUESTS_MODE should be one of {READ_ONLY_REQUESTS_MODES}, got {self.mode!r}.',
+            )
+        self.methods = frozenset(method.upper() for method in settings.READ_ONLY_REQUESTS_METHODS)
+        self.path_prefixes = (*get_static_path_prefixes(), *settings.READ_ONLY_REQUESTS_PATH_PREFIXES)
+        self.using = settings.READ_ONLY_REQUESTS_DB_ALIAS
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if self.is_autocommit(request):
+            return self.get_response(request)
+
+        with self.atomic(request):
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_autocommit(request):
+            return await self.get_response(request)
+
+        return await sync_to_async(self.get_response_in_transaction)(request)
+
+    def get_response_in_transaction(self, request: HttpRequest) -> HttpResponse:
+        with self.atomic(request):
+            # sync views are called back in the current thread, so they share the transaction
+            return async_to_sync(self.get_response)(request)
+
+    def process_exception(self, request: HttpRequest, exception: Exception) -> None:
+        # Django converts unhandled view exceptions to error responses before they reach the middleware,
+        # so mark the transaction explicitly to roll it back as ATOMIC_REQUESTS does. Atomic blocks of autocommit
+        # requests belong to the caller, e.g. to a test, and are left untouched.
+        using = getattr(request, '_read_only_requests_atomic_using', None)
+        if using is not None:
+            transaction.set_rollback(True, using=using)
+
+    def is_read_only(self, request: HttpRequest) -> bool:
+        return request.method in self.methods or request.path_info.startswith(self.path_prefixes)
+
+    def is_autocommit(self, request: HttpRequest) -> bool:
+        if not self.is_read_only(request):
+            return self.is_non_atomic_view(request, transaction.DEFAULT_DB_ALIAS)
+        return self.mode == 'autocommit' or self.is_non_atomic_view(request, self.using)
+
+    def is_non_atomic_view(self, request: HttpRequest, using: str) -> bool:
+        try:
+            resolver_match = resolve(request.path_info, getattr(request, 'urlconf', None))
+        except Resolver404:
+            return False
+        return using in getattr(resolver_match.func, '_non_atomic_requests', set())
+
+    @contextmanager
+    def atomic(self, request: HttpRequest):
+        using = self.using if self.is_read_only(request) else transaction.DEFAULT_DB_ALIAS
+        with transaction.atomic(using=using):
+            if self.is_read_only(request):
+                with connections[using].cursor() as cursor:
+                    cursor.execute('SET TRANSACTION READ ONLY')
+            request._read_only_requests_atomic_using = using
+            try:
+                yield
+            finally:
+                del request._read_only_requests_atomic_using
+
+
+class AsyncCapableMiddlewareMixin:
+    """Turn sync only third party middleware into sync and async capable one.
+
+    Subclasses implement `__acall__` to be used when the middleware chain runs in async mode under ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+
+class EventLoopMiddlewareMixin:
+    """Run `process_request` and `process_response` of Django MiddlewareMixin subclass in the event loop under ASGI.
+
+    MiddlewareMixin calls both methods with `sync_to_async`, which costs two thread switches per middleware on every
+    request. Use the mixin only for middlewares not doing any I/O in these methods, otherwise the event loop gets
+    blocked.
+
+    Session, CSRF and messages middlewares may read session from the database or cache, so they are left as is and
+    still switch to a thread under ASGI. The same is true for `process_view` methods, e.g. of CsrfViewMiddleware.
+    """
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        response = None
+        if hasattr(self, 'process_request'):
+            response = self.process_request(request)
+        response = response or await self.get_response(request)
+        if hasattr(self, 'process_response'):
+            response = self.process_response(request, response)
+        return response
+
+
+class SecurityMiddleware(EventLoopMiddlewareMixin, security.SecurityMiddleware):
+    pass
+
+
+class CommonMiddleware(EventLoopMiddlewareMixin, common.CommonMiddleware):
+    pass
+
+
+class AuthenticationMiddleware(EventLoopMiddlewareMixin, auth_middleware.AuthenticationMiddleware):
+    """Authentication middleware setting lazy `request.user` without leaving the event loop.
+
+    User is loaded from the database or cache on first access, e.g. in the view.
+    """
+
+
+class XFrameOptionsMiddleware(EventLoopMiddlewareMixin, clickjacking.XFrameOptionsMiddleware):
+    pass
+
+
+class WhiteNoiseMiddleware(AsyncCapableMiddlewareMixin, whitenoise_middleware.WhiteNoiseMiddleware):
+    """WhiteNoise middleware passing non-static requests through without leaving the event loop."""
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,20 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from debug_toolbar import middleware as debug_toolbar_middleware
+from django.http import HttpRequest, HttpResponse
+
+from . import AsyncCapableMiddlewareMixin
+
+
+class DebugToolbarMiddleware(AsyncCapableMiddlewareMixin, debug_toolbar_middleware.DebugToolbarMiddleware):
+    """Debug toolbar middleware switching to a thread only when the toolbar is shown."""
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        if iscoroutinefunction(self):
+            self.sync_middleware = debug_toolbar_middleware.DebugToolbarMiddleware(async_to_sync(get_response))
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        show_toolbar = debug_toolbar_middleware.get_show_toolbar()
+        if not show_toolbar(request):
+            return await self.get_response(request)
+        return await sync_to_async(self.sync_middleware)(request)
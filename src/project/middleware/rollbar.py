@@ -0,0 +1,13 @@
+from django.http import HttpRequest, HttpResponse
+from rollbar.contrib.django import middleware as rollbar_middleware
+
+
+class RollbarNotifierMiddlewareExcluding404(rollbar_middleware.RollbarNotifierMiddlewareExcluding404):
+    """Rollbar middleware without thread switch on every async request.
+
+    MiddlewareMixin calls `process_response` through sync_to_async under ASGI although Rollbar's implementation does
+    nothing. Exceptions are still reported with `process_exception`.
+    """
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        return await self.get_response(request)
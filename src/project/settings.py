@@ -16,6 +16,7 @@ from pathlib import Path
 import django
 
 from env_settings import EnvSettings
+from project.log_handlers import get_logging_config
 
 ENV = EnvSettings()
 
@@ -53,26 +54,32 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
 
     # third party apps
-    'debug_toolbar',
     'django_workers',
     'storages',
 
     # custom apps
     'auth.apps.AuthConfig',
 ]
+if ENV.ENABLE_DEBUG_TOOLBAR:
+    INSTALLED_APPS += ['debug_toolbar']
 
+# Optional middlewares are not listed at all when disabled to skip their imports and calls on every request.
+# Middlewares from project.middleware replace Django ones to stay in the event loop under ASGI, other Django
+# middlewares switch to a thread as usual.
 MIDDLEWARE = [
-    'django.middleware.security.SecurityMiddleware',
-    "whitenoise.middleware.WhiteNoiseMiddleware",
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
+    'project.middleware.SecurityMiddleware',
+    'project.middleware.WhiteNoiseMiddleware',
+    *(['project.middleware.debug_toolbar.DebugToolbarMiddleware'] if ENV.ENABLE_DEBUG_TOOLBAR else []),
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.common.CommonMiddleware',
+    'project.middleware.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'project.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'project.middleware.XFrameOptionsMiddleware',
+    # replaces ATOMIC_REQUESTS, so should be below all middlewares not dealing with the database
+    'project.middleware.ReadOnlyRequestsMiddleware',
     # should be close to the list bottom
-    'rollbar.contrib.django.middleware.RollbarNotifierMiddlewareExcluding404',
+    *(['project.middleware.rollbar.RollbarNotifierMiddlewareExcluding404'] if ENV.ROLLBAR else []),
 ]
 
 ROOT_URLCONF = 'project.urls'
@@ -112,6 +119,7 @@ TEMPLATES = [
 FORM_RENDERER = "django.forms.renderers.TemplatesSetting"
 
 WSGI_APPLICATION = 'project.wsgi.application'
+ASGI_APPLICATION = 'project.asgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
@@ -124,10 +132,48 @@ DATABASES = {
         'PASSWORD': ENV.POSTGRES_DSN.password,
         'HOST': ENV.POSTGRES_DSN.host,
         'PORT': ENV.POSTGRES_DSN.port,
-        'ATOMIC_REQUESTS': True,
+        # Transactions per request are managed by ReadOnlyRequestsMiddleware
+        'ATOMIC_REQUESTS': False,
     },
 }
 
+# Requests matching any of HTTP methods or URL prefixes are served without wrapping transaction
+# or inside READ ONLY transaction depending on READ_ONLY_REQUESTS_MODE. Other requests are atomic.
+# STATIC_URL and MEDIA_URL prefixes are read-only too, list here only extra ones.
+READ_ONLY_REQUESTS_MODE = ENV.READ_ONLY_REQUESTS_MODE
+READ_ONLY_REQUESTS_METHODS = ['GET', 'HEAD', 'OPTIONS']
+READ_ONLY_REQUESTS_PATH_PREFIXES = []
+READ_ONLY_REQUESTS_DB_ALIAS = 'default'
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+_CACHE_BACKENDS = {
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+}
+# Sessions and users are cached only in the shared cache. Cache entries are deleted on logout and user changes
+# by the process making them, so with per-process cache other processes would keep serving stale entries.
+if ENV.CACHE:
+    CACHES = {
+        'default': {
+            'BACKEND': _CACHE_BACKENDS[ENV.CACHE.BACKEND],
+            'LOCATION': ENV.CACHE.LOCATION,
+        },
+    }
+
+    # Sessions are read from cache and written to both cache and database
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+    # Users are cached to skip database query of AuthenticationMiddleware. ModelBackend is left to keep sessions
+    # started before the cache was turned on, new logins are saved with the first backend.
+    AUTHENTICATION_BACKENDS = [
+        'auth.backends.CachedModelBackend',
+        'django.contrib.auth.backends.ModelBackend',
+    ]
+
+AUTH_USER_CACHE_TIMEOUT = 300
+
 # Кастомная модель пользователя
 AUTH_USER_MODEL = 'project_auth.User'
 
@@ -154,6 +200,9 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = 'ru-RU'
 
+# Translations of project templates
+LOCALE_PATHS = [BASE_DIR / 'locale']
+
 TIME_ZONE = 'Europe/Moscow'
 
 USE_I18N = True
@@ -193,6 +242,10 @@ DEBUG_TOOLBAR_CONFIG = {
 
 DISABLE_DARK_MODE = True
 
+# Logs are written to stdout as JSON lines by a background thread, so slow log output does not block request
+# and task processing. Task id is added to records logged by django_workers while processing the task.
+LOGGING = get_logging_config(ENV.LOG_LEVEL, ENV.LOG_DEBUG_SAMPLE_RATE, loggers=['django'])
+
 if ENV.ROLLBAR:
     ROLLBAR = {
         'access_token': ENV.ROLLBAR.BACKEND_TOKEN,
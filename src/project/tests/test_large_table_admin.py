@@ -0,0 +1,76 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from auth.admin import UserAdmin
+from auth.models import User
+from .. import large_table_admin
+from ..large_table_admin import EstimatedCountPaginator, estimate_count
+
+
+@pytest.mark.django_db
+def test_estimate_count():
+    User.objects.bulk_create(User(username=f'user-{number}') for number in range(5))
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE {User._meta.db_table}')
+
+    assert estimate_count(User.objects.all()) == 5
+    assert estimate_count(User.objects.filter(username='user-1')) == 1
+
+
+@pytest.mark.django_db
+def test_paginator_uses_estimated_count_above_threshold(monkeypatch):
+    monkeypatch.setattr(large_table_admin, 'estimate_count', lambda queryset: 1_000_000)
+    User.objects.bulk_create(User(username=f'user-{number}') for number in range(3))
+
+    assert EstimatedCountPaginator(User.objects.order_by('pk'), 10).count == 1_000_000
+
+
+@pytest.mark.django_db
+def test_paginator_counts_exactly_below_threshold(monkeypatch):
+    monkeypatch.setattr(large_table_admin, 'estimate_count', lambda queryset: 9_999)
+    User.objects.bulk_create(User(username=f'user-{number}') for number in range(3))
+
+    assert EstimatedCountPaginator(User.objects.order_by('pk'), 10).count == 3
+
+
+@pytest.mark.django_db
+def test_keyset_pagination(admin_client, monkeypatch):
+    monkeypatch.setattr(UserAdmin, 'list_per_page', 2)
+    User.objects.bulk_create(User(username=f'user-{number}') for number in range(3))
+    changelist_url = reverse('admin:project_auth_user_changelist')
+
+    first_response = admin_client.get(changelist_url)
+    first_page = first_response.context['cl']
+    assert first_page.is_keyset_paginated
+    assert 'дальше' in first_response.content.decode()
+    assert [user.username for user in first_page.result_list] == ['user-2', 'user-1']
+    assert first_page.keyset_first_url is None
+
+    second_page = admin_client.get(changelist_url + first_page.keyset_next_url).context['cl']
+    assert [user.username for user in second_page.result_list] == ['user-0', 'admin']
+    assert second_page.keyset_next_url is None
+    assert 'after' not in second_page.keyset_first_url
+    assert 'after' not in second_page.params
+
+
+@pytest.mark.django_db
+def test_fallback_to_page_numbers(admin_client):
+    response = admin_client.get(reverse('admin:project_auth_user_changelist'), {'o': '1'})
+
+    assert not response.context['cl'].is_keyset_paginated
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_with_list_editable(admin_client, monkeypatch):
+    monkeypatch.setattr(large_table_admin, 'estimate_count', lambda queryset: 0)
+    monkeypatch.setattr(UserAdmin, 'list_editable', ['first_name'])
+    monkeypatch.setattr(UserAdmin, 'list_per_page', 1)
+    User.objects.create(username='user')
+    changelist_url = reverse('admin:project_auth_user_changelist')
+
+    response = admin_client.get(changelist_url)
+
+    assert response.context['cl'].is_keyset_paginated
+    assert [form.instance.username for form in response.context['cl'].formset] == ['user']
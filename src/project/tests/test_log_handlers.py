@@ -0,0 +1,104 @@
+import io
+import json
+import logging
+import logging.config
+import runpy
+
+import pytest
+from django_workers import TaskError
+from gunicorn.glogging import CONFIG_DEFAULTS
+
+from ..log_handlers import DebugSamplingFilter, JsonFormatter, QueueListenerHandler, TaskIdFilter
+
+
+@pytest.fixture()
+def stream():
+    return io.StringIO()
+
+
+@pytest.fixture()
+def logger(stream):
+    handler = QueueListenerHandler(stream=stream)
+    handler.setFormatter(JsonFormatter())
+    handler.addFilter(DebugSamplingFilter(rate=0))
+    handler.addFilter(TaskIdFilter())
+
+    logger = logging.getLogger('test_log_handlers')
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+    yield logger
+    logger.removeHandler(handler)
+    handler.close()
+
+
+def read_records(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_written_as_json_by_listener(logger, stream):
+    logger.info('Task %s started', 'first')
+    with TaskError.set_default_task_id(42):
+        try:
+            raise ValueError('failed')
+        except ValueError:
+            logger.exception('Task failed')
+    logger.handlers[0].close()
+
+    started_record, failed_record = read_records(stream)
+    assert started_record['message'] == 'Task first started'
+    assert started_record['level'] == 'INFO'
+    assert started_record['logger'] == 'test_log_handlers'
+    assert 'task_id' not in started_record
+    assert failed_record['task_id'] == 42
+    assert 'ValueError: failed' in failed_record['exception']
+
+
+def test_debug_records_are_sampled(logger, stream):
+    logger.debug('Dropped')
+    logger.info('Kept')
+    logger.handlers[0].close()
+
+    assert [record['message'] for record in read_records(stream)] == ['Kept']
+
+
+def test_records_are_dropped_when_queue_is_full(stream):
+    handler = QueueListenerHandler(stream=stream, maxsize=1)
+    handler.start_listener()
+    handler.listener.stop()
+    record = logging.makeLogRecord({'msg': 'message'})
+
+    handler.handle(record)
+    handler.handle(record)
+
+    assert handler.queue.qsize() == 1
+
+
+@pytest.fixture()
+def restore_logging(settings):
+    yield
+    logging.config.dictConfig(settings.LOGGING)
+
+
+def read_output(capsys, logger_name):
+    logging.getLogger(logger_name).handlers[0].close()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_django_logging_config(settings, capsys, restore_logging):
+    logging.config.dictConfig(settings.LOGGING)
+    logging.getLogger('django.request').warning('Not Found: %s', '/admin/')
+
+    [record] = read_output(capsys, 'django')
+    assert record['logger'] == 'django.request'
+    assert record['message'] == 'Not Found: /admin/'
+
+
+def test_gunicorn_logging_config(settings, capsys, restore_logging):
+    gunicorn_config = runpy.run_path(settings.BASE_DIR / 'gunicorn.conf.py')
+    # Gunicorn merges the config into its defaults the same way
+    logging.config.dictConfig(CONFIG_DEFAULTS | gunicorn_config['logconfig_dict'])
+    logging.getLogger('gunicorn.access').info('"GET /admin/ HTTP/1.1" 200')
+
+    [record] = read_output(capsys, 'gunicorn.access')
+    assert record['logger'] == 'gunicorn.access'
@@ -0,0 +1,191 @@
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.db import InternalError, connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import path
+from django.utils import deprecation
+
+from auth.models import User
+from ..middleware import (
+    AuthenticationMiddleware,
+    CommonMiddleware,
+    ReadOnlyRequestsMiddleware,
+    SecurityMiddleware,
+    WhiteNoiseMiddleware,
+    XFrameOptionsMiddleware,
+)
+from ..middleware.debug_toolbar import DebugToolbarMiddleware
+
+
+def create_user_view(request):
+    User.objects.create(username='admin')
+    if 'fail' in request.GET:
+        raise ValueError('View failed')
+    return HttpResponse(str(connection.in_atomic_block))
+
+
+@transaction.non_atomic_requests
+def create_user_non_atomic_view(request):
+    return create_user_view(request)
+
+
+urlpatterns = [
+    path('users/', create_user_view),
+    path('uploads/users/', create_user_view),
+    path('non-atomic/users/', create_user_non_atomic_view),
+]
+
+
+async def async_get_response(request):
+    return HttpResponse('ok')
+
+
+@pytest.fixture()
+def read_only_settings(settings):
+    settings.READ_ONLY_REQUESTS_MODE = 'autocommit'
+    settings.READ_ONLY_REQUESTS_METHODS = ['get', 'HEAD']
+    settings.READ_ONLY_REQUESTS_PATH_PREFIXES = ['/exports/']
+    settings.STATIC_URL = 'https://cdn.example.org/assets/'
+    settings.MEDIA_URL = '/uploads/'
+    return settings
+
+
+def test_read_only_requests_detection(read_only_settings):
+    middleware = ReadOnlyRequestsMiddleware(lambda request: HttpResponse())
+    factory = RequestFactory()
+
+    assert middleware.is_read_only(factory.get('/admin/project_auth/user/'))
+    assert middleware.is_read_only(factory.head('/admin/'))
+    assert middleware.is_read_only(factory.post('/uploads/images/photo.png'))
+    assert middleware.is_read_only(factory.post('/assets/admin/css/base.css'))
+    assert middleware.is_read_only(factory.post('/exports/users.csv'))
+    assert not middleware.is_read_only(factory.post('/admin/project_auth/user/add/'))
+    assert not middleware.is_read_only(factory.delete('/admin/uploads/'))
+
+
+@pytest.fixture()
+def transaction_client(read_only_settings, client):
+    read_only_settings.ROOT_URLCONF = __name__
+    read_only_settings.MIDDLEWARE = ['project.middleware.ReadOnlyRequestsMiddleware']
+    return client
+
+
+@pytest.mark.django_db(transaction=True)
+def test_write_request_is_atomic(transaction_client):
+    assert transaction_client.post('/users/').content == b'True'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_write_request_rolled_back_on_view_exception(transaction_client):
+    with pytest.raises(ValueError, match='View failed'):
+        transaction_client.post('/users/?fail')
+
+    assert not User.objects.exists()
+
+
+@pytest.mark.django_db
+def test_autocommit_request_exception_keeps_outer_transaction(transaction_client):
+    with pytest.raises(ValueError, match='View failed'):
+        transaction_client.get('/users/?fail')
+
+    assert User.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_only_path_served_without_transaction(transaction_client):
+    assert transaction_client.post('/uploads/users/').content == b'False'
+    assert User.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_non_atomic_view_served_without_transaction(transaction_client):
+    assert transaction_client.post('/non-atomic/users/').content == b'False'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_only_mode_prohibits_writes(read_only_settings, transaction_client):
+    read_only_settings.READ_ONLY_REQUESTS_MODE = 'read_only'
+
+    with pytest.raises(InternalError, match='read-only transaction'):
+        transaction_client.get('/users/')
+
+    assert not User.objects.exists()
+
+
+def test_autocommit_mode_skips_transaction(read_only_settings):
+    def get_response(request):
+        assert not connection.in_atomic_block
+        return HttpResponse('ok')
+
+    middleware = ReadOnlyRequestsMiddleware(get_response)
+    response = middleware(RequestFactory().get('/admin/'))
+
+    assert response.content == b'ok'
+
+
+def test_unknown_mode(read_only_settings):
+    read_only_settings.READ_ONLY_REQUESTS_MODE = 'replica'
+
+    with pytest.raises(ImproperlyConfigured, match='READ_ONLY_REQUESTS_MODE'):
+        ReadOnlyRequestsMiddleware(lambda request: HttpResponse())
+
+
+@pytest.mark.anyio()
+async def test_async_autocommit_mode_stays_in_event_loop(read_only_settings):
+    middleware = ReadOnlyRequestsMiddleware(async_get_response)
+    response = await middleware(RequestFactory().get('/admin/'))
+
+    assert iscoroutinefunction(middleware)
+    assert response.content == b'ok'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_write_request_shares_transaction_with_sync_view(read_only_settings):
+    @sync_to_async
+    def get_response(request):
+        return HttpResponse(str(connection.in_atomic_block))
+
+    middleware = ReadOnlyRequestsMiddleware(get_response)
+    response = async_to_sync(middleware)(RequestFactory().post('/admin/'))
+
+    assert response.content == b'True'
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize('middleware_class', [WhiteNoiseMiddleware, DebugToolbarMiddleware])
+async def test_third_party_middleware_passes_through_in_event_loop(settings, middleware_class):
+    settings.STATIC_ROOT = None
+    middleware = middleware_class(async_get_response)
+    response = await middleware(RequestFactory().get('/admin/'))
+
+    assert iscoroutinefunction(middleware)
+    assert response.content == b'ok'
+
+
+@pytest.mark.anyio()
+@pytest.mark.parametrize(
+    'middleware_class',
+    [SecurityMiddleware, CommonMiddleware, AuthenticationMiddleware, XFrameOptionsMiddleware],
+)
+async def test_django_middleware_runs_in_event_loop(monkeypatch, middleware_class):
+    def sync_to_async(func, **kwargs):
+        raise AssertionError(f'{func.__qualname__} is called in a thread')
+
+    monkeypatch.setattr(deprecation, 'sync_to_async', sync_to_async)
+    middleware = middleware_class(async_get_response)
+    request = RequestFactory().get('/admin/')
+    request.session = {}
+    response = await middleware(request)
+
+    assert iscoroutinefunction(middleware)
+    assert response.content == b'ok'
+
+
+def test_third_party_middleware_keeps_sync_mode(settings):
+    settings.STATIC_ROOT = None
+    middleware = WhiteNoiseMiddleware(lambda request: HttpResponse('ok'))
+
+    assert not iscoroutinefunction(middleware)
+    assert middleware(RequestFactory().get('/admin/')).content == b'ok'
@@ -31,7 +31,7 @@ if settings.ENV.ENABLE_MEDIA_FILES_SERVING:
         re_path(r'^media/(?P<path>.*)$', serve, {'document_root': settings.MEDIA_ROOT}),
     ]
 
-if settings.ENV.DJ.DEBUG:
+if settings.ENV.ENABLE_DEBUG_TOOLBAR:
     urlpatterns += [
         path('__debug__/', include('debug_toolbar.urls')),
     ]
@@ -0,0 +1,14 @@
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """Gunicorn worker serving Django ASGI application with uvloop event loop and httptools parser.
+
+    Lifespan protocol is disabled because Django does not support it.
+    """
+
+    CONFIG_KWARGS = {
+        'loop': 'uvloop',
+        'http': 'httptools',
+        'lifespan': 'off',
+    }
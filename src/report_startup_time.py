@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Report startup time of Django web app and management commands and the most expensive imports.
+
+Every measurement runs in a fresh Python process, so imports are not cached between runs. Startup of management
+commands, e.g. `run_worker`, is measured as `django.setup()` time. Web app startup includes WSGI handler creation
+with the whole middleware chain.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+STARTUP_CODE = '''
+import json
+import time
+
+started_at = time.perf_counter()
+import django
+django.setup()
+setup_finished_at = time.perf_counter()
+
+from django.core.handlers.wsgi import WSGIHandler
+handler = WSGIHandler()
+finished_at = time.perf_counter()
+
+middlewares = []
+layer = handler._middleware_chain
+while hasattr(getattr(layer, '__wrapped__', layer), 'get_response'):
+    middleware = getattr(layer, '__wrapped__', layer)
+    middlewares.append(f'{type(middleware).__module__}.{type(middleware).__qualname__}')
+    layer = middleware.get_response
+
+print(json.dumps({
+    'setup_ms': (setup_finished_at - started_at) * 1000,
+    'web_ms': (finished_at - started_at) * 1000,
+    'middlewares': middlewares,
+}))
+'''
+
+
+def run_startup(importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable, *(['-X', 'importtime'] if importtime else []), '-c', STARTUP_CODE]
+    env = os.environ | {'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'project.settings')}
+    return subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+
+
+def get_import_costs(importtime_output: str) -> dict[str, int]:
+    """Sum cumulative import time of top level packages from `python -X importtime` output in microseconds."""
+    costs: dict[str, int] = defaultdict(int)
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, module_name = line.removeprefix('import time:').split('|')
+        # nested imports are indented and already included into cumulative time of the parent import
+        if module_name.startswith('  '):
+            continue
+        costs[module_name.strip().split('.')[0]] += int(cumulative_us)
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help='Number of startups to take median time of.')
+    parser.add_argument('--top', type=int, default=15, help='Number of the most expensive packages to show.')
+    options = parser.parse_args()
+
+    runs = [json.loads(run_startup().stdout) for _ in range(options.repeat)]
+    importtime_run = run_startup(importtime=True)
+    import_costs = get_import_costs(importtime_run.stderr)
+    middlewares = runs[0]['middlewares']
+
+    print(f'Startup time, median of {options.repeat} runs:')
+    print(f'  django.setup() / management commands: {statistics.median(run["setup_ms"] for run in runs):.0f} ms')
+    print(f'  WSGI handler / web app:               {statistics.median(run["web_ms"] for run in runs):.0f} ms')
+    print()
+    print(f'Middleware chain, {len(middlewares)} middlewares:')
+    for middleware in middlewares:
+        print(f'  {middleware}')
+    print()
+    print(f'Import cost of top {options.top} packages, total {sum(import_costs.values()) / 1000:.0f} ms:')
+    for package, cost_us in sorted(import_costs.items(), key=lambda item: item[1], reverse=True)[:options.top]:
+        print(f'  {cost_us / 1000:>8.1f} ms  {package}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())